@@ -26,6 +26,10 @@ class Outcome(Generic[T], metaclass=abc.ABCMeta):
 class Value(Outcome[T]):
     def __init__(self, value: T):
         self.value = value
+        # Cache the bound method as an instance attribute: the scheduler calls
+        # `outcome.send(coro)` once per task step, and the instance-dict hit
+        # skips the type/MRO lookup on every call.
+        self.send = self.send
 
     def send(self, coro: Coroutine[Any, T, Any]) -> Any:
         return coro.send(self.value)
@@ -40,6 +44,7 @@ class Value(Outcome[T]):
 class Error(Outcome[T]):
     def __init__(self, error: BaseException) -> None:
         self.error = error
+        self.send = self.send
 
     def send(self, coro: Coroutine[Any, T, Any]) -> Any:
         return coro.throw(self.error)
@@ -15,7 +15,7 @@ import logging
 import os
 import threading
 from collections import OrderedDict
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Final, Iterable
 
 import mycocotb
 import mycocotb._write_scheduler
@@ -33,7 +33,8 @@ from mycocotb.triggers import (
 # Sadly the Python standard logging module is very slow so it's better not to
 # make any calls by testing a boolean flag first
 # _debug = "COCOTB_SCHEDULER_DEBUG" in os.environ
-_debug = False
+# Guard uses with ``if __debug__ and _debug:`` so -O removes the branch.
+_debug: Final[bool] = False
 
 
 class external_state:
@@ -120,7 +121,7 @@ class Scheduler:
         self._test_complete_cb = test_complete_cb
 
         self.log = logging.getLogger("mycocotb.scheduler")
-        if _debug:
+        if __debug__ and _debug:
             self.log.setLevel(logging.DEBUG)
 
         # A dictionary of pending tasks for each trigger,
@@ -142,7 +143,7 @@ class Scheduler:
         """
         Handle a termination that causes us to move onto the next test.
         """
-        if _debug:
+        if __debug__ and _debug:
             self.log.debug("Scheduler terminating...")
 
         # cleanup triggers and tasks
@@ -181,7 +182,7 @@ class Scheduler:
 
         Finds all Tasks waiting on the Trigger that fired and queues them.
         """
-        if _debug:
+        if __debug__ and _debug:
             self.log.debug(f"Trigger fired: {trigger}")
 
         # find all tasks waiting on trigger that fired
@@ -197,11 +198,11 @@ class Scheduler:
             # For Python triggers this isn't actually an error - we might do
             # event.set() without knowing whether any tasks are actually
             # waiting on this event, for example
-            elif _debug:
+            elif __debug__ and _debug:
                 self.log.debug(f"No tasks waiting on trigger that fired: {trigger}")
             return
 
-        if _debug:
+        if __debug__ and _debug:
             debugstr = "\n\t".join([str(task) for task in scheduling])
             if len(scheduling) > 0:
                 debugstr = "\n\t" + debugstr
@@ -218,6 +219,26 @@ class Scheduler:
         # cleanup trigger
         trigger._cleanup()
 
+    def _react_many(self, triggers: Iterable[Trigger]) -> None:
+        """Queue all Tasks waiting on a batch of fired triggers.
+
+        Batch entry point used by :meth:`Event.set`: the waiting tasks are
+        gathered first and appended to the run queue together, rather than
+        re-entering :meth:`_react` once per waiter.
+        """
+        pop = self._trigger2tasks.pop
+        scheduling: list[Task] = []
+        for trigger in triggers:
+            tasks = pop(trigger, None)
+            if tasks is None:
+                # see _react: not an error for Python triggers
+                continue
+            scheduling.extend(tasks)
+            trigger._cleanup()
+        for task in scheduling:
+            task._trigger = None
+            self._schedule_task(task)
+
     def _event_loop(self) -> None:
         """Run the main event loop.
 
@@ -229,10 +250,10 @@ class Scheduler:
         while self._scheduled_tasks and not self._terminate:
             task, outcome = self._scheduled_tasks.popitem(last=False)
 
-            if _debug:
+            if __debug__ and _debug:
                 self.log.debug(f"Scheduling task {task}")
             self._resume_task(task, outcome)
-            if _debug:
+            if __debug__ and _debug:
                 self.log.debug(f"Scheduled task {task}")
 
             # remove our reference to the objects at the end of each loop,
@@ -242,7 +263,7 @@ class Scheduler:
 
             # Schedule may have queued up some events so we'll burn through those
             while self._pending_events:
-                if _debug:
+                if __debug__ and _debug:
                     self.log.debug(
                         f"Scheduling pending event {self._pending_events[0]}"
                     )
@@ -251,7 +272,7 @@ class Scheduler:
         # no more pending tasks
         if self._terminate:
             self._handle_termination()
-        elif _debug:
+        elif __debug__ and _debug:
             self.log.debug("All tasks scheduled, handing control back to simulator")
 
     def _unschedule(self, task: Task[Any]) -> None:
@@ -377,13 +398,13 @@ class Scheduler:
     # `isinstance` checks.
 
     def _trigger_from_started_task(self, result: Task) -> Trigger:
-        if _debug:
+        if __debug__ and _debug:
             self.log.debug(f"Joining to already running task: {result}")
         return result.complete
 
     def _trigger_from_unstarted_task(self, result: Task) -> Trigger:
         self._schedule_task(result)
-        if _debug:
+        if __debug__ and _debug:
             self.log.debug(f"Scheduling unstarted task: {result!r}")
         return result.complete
 
@@ -427,7 +448,7 @@ class Scheduler:
             result = task._advance(outcome=outcome)
 
             if task.done():
-                if _debug:
+                if __debug__ and _debug:
                     self.log.debug(f"{task} completed with {task._outcome}")
                 assert result is None
                 self._unschedule(task)
@@ -437,7 +458,7 @@ class Scheduler:
                 return
 
             if not task.done():
-                if _debug:
+                if __debug__ and _debug:
                     self.log.debug(f"{task!r} yielded {result} ({mycocotb.sim_phase})")
                 try:
                     result = self._trigger_from_any(result)
@@ -455,12 +476,12 @@ class Scheduler:
             if self._main_thread is threading.current_thread():
                 for ext in self._pending_threads:
                     ext.thread_start()
-                    if _debug:
+                    if __debug__ and _debug:
                         self.log.debug(
                             f"Blocking from {threading.current_thread()} on {ext.thread}"
                         )
                     state = ext.thread_wait()
-                    if _debug:
+                    if __debug__ and _debug:
                         self.log.debug(
                             f"Back from wait on self {threading.current_thread()} with newstate {state}"
                         )
@@ -482,7 +503,7 @@ class Scheduler:
         # arbitrary.
         for _, waiting in items[::-1]:
             for task in waiting:
-                if _debug:
+                if __debug__ and _debug:
                     self.log.debug(f"Killing {task}")
                 task.kill()
             # we don't unprime trigger here since removing all tasks waiting on
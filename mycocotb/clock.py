@@ -0,0 +1,89 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""A clock class."""
+from decimal import Decimal
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import mycocotb
+from mycocotb.task import Task
+from mycocotb.triggers import Timer
+from mycocotb.utils import get_sim_steps
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mycocotb.handle import ValueObjectBase
+
+
+class Clock:
+    r"""Simple 50:50 duty cycle clock driver.
+
+    .. code-block:: python3
+
+        Clock(dut.clk, 10, units="ns").start()
+
+    Args:
+        signal: The clock pin/signal to be driven.
+        period: The clock period. Must convert to an even number of
+            timesteps.
+        units: One of ``'step'``, ``'fs'``, ``'ps'``, ``'ns'``, ``'us'``, ``'ms'``, ``'sec'``.
+            When *units* is ``'step'``,
+            the timestep is determined by the simulator (see :make:var:`COCOTB_HDL_TIMEPRECISION`).
+
+    If you need more features like a phase shift and an asymmetric duty cycle,
+    it is simple to create your own clock generator (that you then :func:`mycocotb.start_soon`).
+    Note that driving the clock from the HDL side, where the simulator can
+    schedule every edge without re-entering Python, is always cheaper than
+    any Python clock driver.
+    """
+
+    __slots__ = ("signal", "period", "units", "_task")
+
+    def __init__(
+        self,
+        signal: "ValueObjectBase[Any, Any]",
+        period: Union[float, Fraction, Decimal],
+        units: str = "step",
+    ) -> None:
+        self.signal = signal
+        self.period = period
+        self.units = units
+        self._task: Optional[Task[None]] = None
+
+    def start(self, start_high: bool = True) -> Task[None]:
+        """Start driving the clock signal; returns the driving :class:`Task`.
+
+        Args:
+            start_high: Whether to start the clock with a ``1``
+                for the first half of the period.
+        """
+        if self._task is not None:
+            raise RuntimeError("Clock is already started")
+        self._task = mycocotb.start_soon(self._drive(start_high))
+        return self._task
+
+    def stop(self) -> None:
+        """Stop driving the clock signal."""
+        if self._task is None:
+            raise RuntimeError("Clock is not started")
+        self._task.kill()
+        self._task = None
+
+    async def _drive(self, start_high: bool) -> None:
+        # The two half-period Timers are built once and re-primed forever:
+        # each cycle then costs two C callback registrations instead of two
+        # Timer allocations plus the step conversion.
+        steps = get_sim_steps(self.period, self.units)
+        half = steps // 2
+        t_first = Timer(half or 1)
+        t_second = Timer((steps - half) or 1)
+        signal = self.signal
+        first, second = (1, 0) if start_high else (0, 1)
+        while True:
+            signal.value = first
+            await t_first
+            signal.value = second
+            await t_second
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__}, {self.period} {self.units} period>"
@@ -5,6 +5,7 @@
 import enum
 import logging
 import re
+import weakref
 from abc import ABC, abstractmethod
 from functools import lru_cache
 from logging import Logger
@@ -15,6 +16,7 @@ from typing import (
     Generic,
     Iterable,
     Iterator,
+    List,
     NoReturn,
     Optional,
     Sequence,
@@ -877,10 +879,10 @@ _ConcreteHandleTypes = Union[
 ]
 
 
-_handle2obj: Dict[
-    simulator.gpi_sim_hdl,
-    _ConcreteHandleTypes,
-] = {}
+# Weak values so the cache doesn't grow unboundedly over a long simulation:
+# handles stay cached for as long as user code holds the object, and are
+# re-created transparently once all strong references are dropped.
+_handle2obj: "weakref.WeakValueDictionary[simulator.gpi_sim_hdl, _ConcreteHandleTypes]" = weakref.WeakValueDictionary()
 
 _type2cls: Dict[int, Type[_ConcreteHandleTypes]] = {
     simulator.MODULE: HierarchyObject,
@@ -897,6 +899,15 @@ _type2cls: Dict[int, Type[_ConcreteHandleTypes]] = {
     # simulator.PACKAGE: HierarchyObject,
 }
 
+# GPI type codes are small dense integers, so dispatching through a list index
+# is cheaper than a dict lookup on the hierarchy-walking path.
+_type2cls_arr: List[Optional[Type[_ConcreteHandleTypes]]] = [None] * (
+    max(_type2cls) + 1
+)
+for _type_code, _handle_cls in _type2cls.items():
+    _type2cls_arr[_type_code] = _handle_cls
+del _type_code, _handle_cls
+
 
 def SimHandle(
     handle: simulator.gpi_sim_hdl, path: Optional[str] = None
@@ -922,10 +933,11 @@ def SimHandle(
         pass
 
     t = handle.get_type()
-    if t not in _type2cls:
+    cls = _type2cls_arr[t] if 0 <= t < len(_type2cls_arr) else None
+    if cls is None:
         raise NotImplementedError(
             f"Couldn't find a matching object for GPI type {handle.get_type_string()}({t}) (path={path})"
         )
-    obj = _type2cls[t](handle, path)
+    obj = cls(handle, path)
     _handle2obj[handle] = obj
     return obj
@@ -1,9 +1,10 @@
 # Copyright cocotb contributors
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
-import collections.abc
 import inspect
+import itertools
 import logging
+import types
 import os
 import warnings
 from asyncio import CancelledError, InvalidStateError
@@ -12,6 +13,8 @@ from typing import (
     Any,
     Callable,
     Coroutine,
+    Dict,
+    Final,
     Generator,
     Generic,
     List,
@@ -22,7 +25,6 @@ from typing import (
 import mycocotb
 import mycocotb.triggers
 from mycocotb._outcomes import Error, Outcome, Value
-from functools import cached_property
 from enum import Enum
 from mycocotb._utils import extract_coro_stack, remove_traceback_frames
 
@@ -30,8 +32,24 @@ from mycocotb._utils import extract_coro_stack, remove_traceback_frames
 ResultType = TypeVar("ResultType")
 
 # Sadly the Python standard logging module is very slow so it's better not to
-# make any calls by testing a boolean flag first
-_debug = "COCOTB_SCHEDULER_DEBUG" in os.environ
+# make any calls by testing a boolean flag first.  Guard uses of this flag with
+# ``if __debug__ and _debug:`` so the whole branch is compiled away under -O.
+_debug: Final[bool] = "COCOTB_SCHEDULER_DEBUG" in os.environ
+
+# Sentinel for not-yet-computed lazy attributes.  A hand-rolled cache is a
+# plain getattr on the hit path, without functools.cached_property's locking
+# and descriptor overhead.
+_UNSET: Final[Any] = object()
+
+# Emit the FutureWarning from Task.cancel() only once per process: the
+# stacklevel walk in warnings.warn is costly when teardown cancels many tasks,
+# and repeating the notice adds no information.
+_cancel_warned = False
+
+# Task id generator, used by the scheduler for debug.
+# itertools.count is C-implemented, so this is atomic and cheaper than
+# incrementing a class attribute on every Task construction.
+_task_id_gen = itertools.count().__next__
 
 
 class Task(Generic[ResultType]):
@@ -61,41 +79,55 @@ class Task(Generic[ResultType]):
         CANCELLED = (auto(), "Task was cancelled before it finished")
 
     _name: str = "Task"  # class name of schedulable task
-    _id_count = 0  # used by the scheduler for debug
 
     def __init__(self, inst):
-        if inspect.iscoroutinefunction(inst):
-            raise TypeError(
-                f"Coroutine function {inst} should be called prior to being "
-                "scheduled."
-            )
-        elif inspect.isasyncgen(inst):
-            raise TypeError(
-                f"{inst.__qualname__} is an async generator, not a coroutine. "
-                "You likely used the yield keyword instead of await."
-            )
-        elif not isinstance(inst, collections.abc.Coroutine):
-            raise TypeError(f"{inst} isn't a valid coroutine!")
+        # Native coroutines are by far the common case; an exact type check is
+        # much cheaper than the Coroutine ABC's isinstance machinery, so only
+        # non-native awaitables go through the full validation below.
+        if type(inst) is not types.CoroutineType:
+            if inspect.iscoroutinefunction(inst):
+                raise TypeError(
+                    f"Coroutine function {inst} should be called prior to being "
+                    "scheduled."
+                )
+            elif inspect.isasyncgen(inst):
+                raise TypeError(
+                    f"{inst.__qualname__} is an async generator, not a coroutine. "
+                    "You likely used the yield keyword instead of await."
+                )
+            elif not (hasattr(inst, "send") and hasattr(inst, "__await__")):
+                raise TypeError(f"{inst} isn't a valid coroutine!")
 
         self._coro: Coroutine = inst
         self._state: Task._State = Task._State.UNSTARTED
         self._outcome: Optional[Outcome[ResultType]] = None
         self._trigger: Optional[cocotb.triggers.Trigger] = None
         self._cancelled_error: Optional[CancelledError] = None
+        # Kept in sync with _state; lets done() and the TaskComplete trigger
+        # test completion with a single attribute load.
+        self._done: bool = False
         self._done_callbacks: List[Callable[[Task[Any]], Any]] = []
-
-        self._task_id = self._id_count
-        type(self)._id_count += 1
+        # Resolve the scheduler once per Task instead of two attribute
+        # lookups on every kill()/cancel(); Tasks created before init
+        # (e.g. in unit contexts) pick it up lazily on first use.
+        self._scheduler = getattr(mycocotb, "_scheduler_inst", None)
+        self._log: Any = _UNSET
+        self._complete: Any = _UNSET
+
+        self._task_id = _task_id_gen()
         self.__name__ = f"{type(self)._name} {self._task_id}"
         self.__qualname__ = self.__name__
 
-    @cached_property
+    @property
     def log(self) -> logging.Logger:
         # Creating a logger is expensive, only do it if we actually plan to
         # log anything
-        return logging.getLogger(
-            f"cocotb.{self.__qualname__}.{self._coro.__qualname__}"
-        )
+        v = self._log
+        if v is _UNSET:
+            v = self._log = logging.getLogger(
+                f"cocotb.{self.__qualname__}.{self._coro.__qualname__}"
+            )
+        return v
 
     def __str__(self) -> str:
         return f"<{self.__name__}>"
@@ -111,31 +143,25 @@ class Task(Generic[ResultType]):
         return coro_stack
 
     def __repr__(self) -> str:
-        coro_stack = self._get_coro_stack()
-
-        if self._state is Task._State.RUNNING:
-            fmt = "<{name} running coro={coro}()>"
-        elif self._state is Task._State.FINISHED:
-            fmt = "<{name} finished coro={coro}() outcome={outcome}>"
-        elif self._state is Task._State.PENDING:
-            fmt = "<{name} pending coro={coro}() trigger={trigger}>"
-        elif self._state is Task._State.SCHEDULED:
-            fmt = "<{name} scheduled coro={coro}()>"
-        elif self._state is Task._State.UNSTARTED:
-            fmt = "<{name} created coro={coro}()>"
-        elif self._state is Task._State.CANCELLED:
-            fmt = (
-                "<{name} cancelled coro={coro} with={cancelled_error} outcome={outcome}"
-            )
-        else:
+        state = self._state
+        fmt = _STATE_REPR_FMT.get(state)
+        if fmt is None:
             raise RuntimeError("Task in unknown state")
 
-        try:
-            coro_name = coro_stack[-1].name
-        # coro_stack may be empty if:
-        # - exhausted generator
-        # - finished coroutine
-        except IndexError:
+        coro_name = None
+        # Only suspended/running tasks have an interesting topmost frame;
+        # everywhere else the coroutine's own name is correct and skipping
+        # the frame introspection makes repr much cheaper.
+        if state is Task._State.PENDING or state is Task._State.RUNNING:
+            coro_stack = self._get_coro_stack()
+            try:
+                coro_name = coro_stack[-1].name
+            # coro_stack may be empty if:
+            # - exhausted generator
+            # - finished coroutine
+            except IndexError:
+                pass
+        if coro_name is None:
             try:
                 coro_name = self._coro.__name__
             except AttributeError:
@@ -166,6 +192,7 @@ class Task(Generic[ResultType]):
         except StopIteration as e:
             self._outcome = Value(e.value)
             self._state = Task._State.FINISHED
+            self._done = True
         except (KeyboardInterrupt, SystemExit):
             # Allow these to bubble up to the execution root to fail the sim immediately.
             # This follows asyncio's behavior.
@@ -173,8 +200,9 @@ class Task(Generic[ResultType]):
         except BaseException as e:
             self._outcome = Error(remove_traceback_frames(e, ["_advance", "send"]))
             self._state = Task._State.FINISHED
+            self._done = True
 
-        if self.done():
+        if self._done:
             self._do_done_callbacks()
 
     def kill(self) -> None:
@@ -183,26 +211,33 @@ class Task(Generic[ResultType]):
             # already finished, nothing to kill
             return
 
-        if _debug:
+        if __debug__ and _debug:
             self.log.debug("kill() called on coroutine")
         # todo: probably better to throw an exception for anyone waiting on the coroutine
         self._outcome = Value(None)
-        mycocotb._scheduler_inst._unschedule(self)
+        scheduler = self._scheduler
+        if scheduler is None:
+            scheduler = self._scheduler = mycocotb._scheduler_inst
+        scheduler._unschedule(self)
 
         # Close coroutine so there is no RuntimeWarning that it was never awaited
         self._coro.close()
 
         self._state = Task._State.FINISHED
+        self._done = True
         self._do_done_callbacks()
 
     def _do_done_callbacks(self) -> None:
         for callback in self._done_callbacks:
             callback(self)
 
-    @cached_property
+    @property
     def complete(self) -> "cocotb.triggers.TaskComplete[ResultType]":
         r"""Trigger which fires when the Task completes."""
-        return mycocotb.triggers.TaskComplete._make(self)
+        v = self._complete
+        if v is _UNSET:
+            v = self._complete = mycocotb.triggers.TaskComplete._make(self)
+        return v
 
     def cancel(self, msg: Optional[str] = None) -> None:
         """Cancel a Task's further execution.
@@ -213,18 +248,25 @@ class Task(Generic[ResultType]):
             return
 
         self._cancelled_error = CancelledError(msg)
-        warnings.warn(
-            "Calling this method will cause a CancelledError to be thrown in the "
-            "Task sometime in the future.",
-            FutureWarning,
-            stacklevel=2,
-        )
-        mycocotb._scheduler_inst._unschedule(self)
+        global _cancel_warned
+        if not _cancel_warned:
+            _cancel_warned = True
+            warnings.warn(
+                "Calling this method will cause a CancelledError to be thrown in the "
+                "Task sometime in the future.",
+                FutureWarning,
+                stacklevel=2,
+            )
+        scheduler = self._scheduler
+        if scheduler is None:
+            scheduler = self._scheduler = mycocotb._scheduler_inst
+        scheduler._unschedule(self)
 
         # Close coroutine so there is no RuntimeWarning that it was never awaited
         self._coro.close()
 
         self._state = Task._State.CANCELLED
+        self._done = True
         self._do_done_callbacks()
 
     def cancelled(self) -> bool:
@@ -233,7 +275,7 @@ class Task(Generic[ResultType]):
 
     def done(self) -> bool:
         """Return ``True`` if the Task has finished executing."""
-        return self._state in (Task._State.FINISHED, Task._State.CANCELLED)
+        return self._done
 
     def result(self) -> ResultType:
         """Return the result of the Task.
@@ -277,8 +319,11 @@ class Task(Generic[ResultType]):
         .. note::
             If the task is already done, calling this function will call the callback immediately.
         """
-        if self.done():
+        if self._done:
+            # Already done: run the callback now and don't store it, it would
+            # never be invoked again.
             callback(self)
+            return
         self._done_callbacks.append(callback)
 
     def __await__(self) -> Generator[Any, Any, ResultType]:
@@ -293,3 +338,17 @@ class Task(Generic[ResultType]):
         yield self
         return self.result()
 
+
+
+# Table-driven replacement for the if/elif state cascade in Task.__repr__:
+# one dict lookup instead of up to six enum attribute loads and comparisons.
+_STATE_REPR_FMT: Dict[Task._State, str] = {
+    Task._State.RUNNING: "<{name} running coro={coro}()>",
+    Task._State.FINISHED: "<{name} finished coro={coro}() outcome={outcome}>",
+    Task._State.PENDING: "<{name} pending coro={coro}() trigger={trigger}>",
+    Task._State.SCHEDULED: "<{name} scheduled coro={coro}()>",
+    Task._State.UNSTARTED: "<{name} created coro={coro}()>",
+    Task._State.CANCELLED: (
+        "<{name} cancelled coro={coro} with={cancelled_error} outcome={outcome}"
+    ),
+}
@@ -17,10 +17,11 @@ from typing import (
     Callable,
     ClassVar,
     Coroutine,
+    Dict,
     Generator,
     Generic,
-    List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -32,7 +33,6 @@ import mycocotb.handle
 import mycocotb.task
 from mycocotb import simulator
 from mycocotb._outcomes import Error, Outcome, Value
-from functools import cached_property
 from mycocotb._utils import (
     singleton,
 )
@@ -40,30 +40,79 @@ from mycocotb.utils import get_sim_steps, get_time_from_sim_steps
 
 T = TypeVar("T")
 
+# Registrars bound once at import: each _prime call then loads one global
+# instead of walking the simulator module's attributes.  The singleton
+# triggers bind their registrar per instance for the same reason.
+_register_timed = simulator.register_timed_callback
+_register_value_change = simulator.register_value_change_callback
+
 
 def _pointer_str(obj: object) -> str:
     """Get the memory address of *obj* as used in :meth:`object.__repr__`.
 
     This is equivalent to ``sprintf("%p", id(obj))``, but python does not
-    support ``%p``.
+    support ``%p``.  Formatting :func:`id` directly skips building and
+    splitting the full ``object.__repr__`` string.
     """
-    full_repr = object.__repr__(obj)  # gives "<{type} object at {address}>"
-    return full_repr.rsplit(" ", 1)[1][:-1]
+    return f"0x{id(obj):x}"
 
 
 Self = TypeVar("Self", bound="Trigger")
 
 
+class _TriggerIter:
+    """Iterator returned by :meth:`Trigger.__await__`.
+
+    A slotted two-state iterator in place of the old ``yield self``
+    generator: awaiting a trigger no longer allocates a generator frame,
+    which matters in task-switch-heavy workloads.
+    """
+
+    __slots__ = ("_trigger", "_yielded")
+
+    def __init__(self, trigger: "Trigger") -> None:
+        self._trigger = trigger
+        self._yielded = False
+
+    def __iter__(self) -> "_TriggerIter":
+        return self
+
+    def __next__(self) -> "Trigger":
+        if self._yielded:
+            # hands the trigger back as the value of the await expression
+            raise StopIteration(self._trigger)
+        self._yielded = True
+        return self._trigger
+
+    def send(self, value: Any) -> "Trigger":
+        # the scheduler only ever resumes trigger awaits with None, but the
+        # yield-from machinery may still route that through send()
+        return self.__next__()
+
+
 class Trigger(Awaitable["Trigger"]):
     """Base class to derive from."""
 
+    # Triggers are created in the tens of thousands in busy simulations;
+    # __slots__ (here and in subclasses) drops the per-instance __dict__.
+    __slots__ = ("_primed",)
+
+    # One logger per Trigger class, built when the class is defined: trigger
+    # construction then never pays for name formatting or the getLogger
+    # registry lookup, and instances that never log stay logger-free.
+    _cls_log: ClassVar[logging.Logger] = logging.getLogger("cocotb.Trigger")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._cls_log = logging.getLogger(f"cocotb.{cls.__qualname__}")
+
     def __init__(self) -> None:
         self._primed = False
 
-    @cached_property
+    @property
     def log(self) -> logging.Logger:
         """A :class:`logging.Logger` for the trigger."""
-        return logging.getLogger(f"cocotb.{type(self).__qualname__}.0x{id(self):x}")
+        return type(self)._cls_log
 
     def _prime(self, callback: Callable[["Trigger"], None]) -> None:
         """Set a callback to be invoked when the trigger fires.
@@ -99,8 +148,7 @@ class Trigger(Awaitable["Trigger"]):
         self._primed = False
 
     def __await__(self: Self) -> Generator[Self, None, Self]:
-        yield self
-        return self
+        return cast("Generator[Self, None, Self]", _TriggerIter(self))
 
 
 class GPITrigger(Trigger):
@@ -109,6 +157,8 @@ class GPITrigger(Trigger):
     Consumes simulation time.
     """
 
+    __slots__ = ("_cbhdl",)
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -118,15 +168,55 @@ class GPITrigger(Trigger):
         # else:
         self._cbhdl: Optional[simulator.gpi_cb_hdl] = None
 
+    # Teardown is flattened here rather than chaining through
+    # Trigger._unprime -> _cleanup -> super()._cleanup: clearing two fields
+    # doesn't warrant four Python-level calls on every trigger teardown.
+
     def _unprime(self) -> None:
         """Disable a primed trigger, can be re-primed."""
-        if self._cbhdl is not None:
-            self._cbhdl.deregister()
-        return super()._unprime()
+        cbhdl = self._cbhdl
+        if cbhdl is not None:
+            cbhdl.deregister()
+            self._cbhdl = None
+        self._primed = False
 
     def _cleanup(self) -> None:
         self._cbhdl = None
-        return super()._cleanup()
+        self._primed = False
+
+
+# Timers are typically built over and over with the same duration (clock
+# generators, polling loops), so remember the step conversion per
+# (time, units, round_mode) triple and skip the decimal/fraction arithmetic.
+_sim_steps_cache: Dict[Tuple[Union[float, Fraction, Decimal], str, str], int] = {}
+
+
+def _timer_build(
+    time: Union[float, Fraction, Decimal], units: str, round_mode: str
+) -> int:
+    """Validate *time* and convert it to a positive number of simulator steps.
+
+    Single flat entry point for Timer construction: range check, cached
+    conversion and the 0-step clamp in one call, so ``Timer.__init__`` stays
+    minimal.  This is also the natural seam to push down into the simulator
+    extension should conversion ever dominate profiles.
+    """
+    if time <= 0:
+        raise ValueError("Timer argument time must be positive")
+    key = (time, units, round_mode)
+    try:
+        return _sim_steps_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable time value; convert without caching
+        key = None
+    # If we round to 0, we fix it up to 1 step as rounding is imprecise,
+    # and Timer(0) is invalid.
+    sim_steps = get_sim_steps(time, units, round_mode=round_mode) or 1
+    if key is not None:
+        _sim_steps_cache[key] = sim_steps
+    return sim_steps
 
 
 class Timer(GPITrigger):
@@ -199,6 +289,8 @@ class Timer(GPITrigger):
         Passing ``0`` as the *time* argument now raises a :exc:`ValueError`.
     """
 
+    __slots__ = ("_sim_steps",)
+
     round_mode: str = "error"
     """The default rounding mode."""
 
@@ -210,22 +302,14 @@ class Timer(GPITrigger):
         round_mode: Optional[str] = None,
     ) -> None:
         super().__init__()
-        if time <= 0:
-            raise ValueError("Timer argument time must be positive")
         if round_mode is None:
             round_mode = type(self).round_mode
-        self._sim_steps = get_sim_steps(time, units, round_mode=round_mode)
-        # If we round to 0, we fix it up to 1 step as rounding is imprecise,
-        # and Timer(0) is invalid.
-        if self._sim_steps == 0:
-            self._sim_steps = 1
+        self._sim_steps = _timer_build(time, units, round_mode)
 
     def _prime(self, callback: Callable[[Trigger], None]) -> None:
         """Register for a timed callback."""
         if self._cbhdl is None:
-            self._cbhdl = simulator.register_timed_callback(
-                self._sim_steps, callback, self
-            )
+            self._cbhdl = _register_timed(self._sim_steps, callback, self)
             if self._cbhdl is None:
                 raise RuntimeError(f"Unable set up {str(self)} Trigger")
         super()._prime(callback)
@@ -248,16 +332,30 @@ class ReadOnly(GPITrigger):
     Useful for monitors which need to wait for all processes to execute (both RTL and cocotb) to ensure sampled signal values are final.
     """
 
+    # The singletons are primed over and over; bind the C registrar at
+    # construction and look the READ_ONLY phase constant up lazily (SimPhase
+    # is defined after this module is imported), so steady-state _prime is a
+    # couple of instance-attribute loads, one branch and one C call.
+    __slots__ = ("_register", "_phase_read_only")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._register = simulator.register_readonly_callback
+        self._phase_read_only: Optional[Any] = None
+
     def _prime(self, callback: Callable[[Trigger], None]) -> None:
-        if mycocotb.sim_phase is mycocotb.SimPhase.READ_ONLY:
+        phase_read_only = self._phase_read_only
+        if phase_read_only is None:
+            phase_read_only = self._phase_read_only = mycocotb.SimPhase.READ_ONLY
+        if mycocotb.sim_phase is phase_read_only:
             raise RuntimeError(
                 "Attempted illegal transition: awaiting ReadOnly in ReadOnly phase"
             )
         if self._cbhdl is None:
-            self._cbhdl = simulator.register_readonly_callback(callback, self)
+            self._cbhdl = self._register(callback, self)
             if self._cbhdl is None:
                 raise RuntimeError(f"Unable set up {str(self)} Trigger")
-        super()._prime(callback)
+        self._primed = True
 
     def __repr__(self) -> str:
         return f"{type(self).__qualname__}()"
@@ -267,16 +365,26 @@ class ReadOnly(GPITrigger):
 class ReadWrite(GPITrigger):
     """Fires when the read-write simulation phase is reached."""
 
+    __slots__ = ("_register", "_phase_read_only")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._register = simulator.register_rwsynch_callback
+        self._phase_read_only: Optional[Any] = None
+
     def _prime(self, callback: Callable[[Trigger], None]) -> None:
-        if mycocotb.sim_phase is mycocotb.SimPhase.READ_ONLY:
+        phase_read_only = self._phase_read_only
+        if phase_read_only is None:
+            phase_read_only = self._phase_read_only = mycocotb.SimPhase.READ_ONLY
+        if mycocotb.sim_phase is phase_read_only:
             raise RuntimeError(
                 "Attempted illegal transition: awaiting ReadWrite in ReadOnly phase"
             )
         if self._cbhdl is None:
-            self._cbhdl = simulator.register_rwsynch_callback(callback, self)
+            self._cbhdl = self._register(callback, self)
             if self._cbhdl is None:
                 raise RuntimeError(f"Unable set up {str(self)} Trigger")
-        super()._prime(callback)
+        self._primed = True
 
     def __repr__(self) -> str:
         return f"{type(self).__qualname__}()"
@@ -286,12 +394,18 @@ class ReadWrite(GPITrigger):
 class NextTimeStep(GPITrigger):
     """Fires when the next time step is started."""
 
+    __slots__ = ("_register",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._register = simulator.register_nextstep_callback
+
     def _prime(self, callback: Callable[[Trigger], None]) -> None:
         if self._cbhdl is None:
-            self._cbhdl = simulator.register_nextstep_callback(callback, self)
+            self._cbhdl = self._register(callback, self)
             if self._cbhdl is None:
                 raise RuntimeError(f"Unable set up {str(self)} Trigger")
-        super()._prime(callback)
+        self._primed = True
 
     def __repr__(self) -> str:
         return f"{type(self).__qualname__}()"
@@ -300,20 +414,26 @@ class NextTimeStep(GPITrigger):
 class _EdgeBase(GPITrigger):
     """Internal base class that fires on a given edge of a signal."""
 
+    __slots__ = ("signal", "_edge")
+
     _edge_type: ClassVar[int]
 
     def __init__(self, signal: mycocotb.handle.ValueObjectBase[Any, Any]) -> None:
         super().__init__()
         self.signal = signal
+        # Resolve the class-level edge constant once; re-arming monitors prime
+        # the same trigger every cycle and shouldn't repeat the MRO walk.
+        self._edge = type(self)._edge_type
 
     def _prime(self, callback: Callable[[Trigger], None]) -> None:
         if self._cbhdl is None:
-            self._cbhdl = simulator.register_value_change_callback(
-                self.signal._handle, callback, type(self)._edge_type, self
+            self._cbhdl = _register_value_change(
+                self.signal._handle, callback, self._edge, self
             )
             if self._cbhdl is None:
                 raise RuntimeError(f"Unable set up {str(self)} Trigger")
-        super()._prime(callback)
+        # inlined Trigger._prime
+        self._primed = True
 
     def __repr__(self) -> str:
         return f"{type(self).__qualname__}({self.signal!r})"
@@ -335,6 +455,8 @@ class RisingEdge(_EdgeBase):
         not just from ``0`` to ``1`` like the ``rising_edge`` function in VHDL.
     """
 
+    __slots__ = ()
+
     _edge_type = simulator.RISING
 
     @classmethod
@@ -364,6 +486,8 @@ class FallingEdge(_EdgeBase):
         not just from ``1`` to ``0`` like the ``falling_edge`` function in VHDL.
     """
 
+    __slots__ = ()
+
     _edge_type = simulator.FALLING
 
     @classmethod
@@ -387,6 +511,8 @@ class Edge(_EdgeBase):
         TypeError: If the signal is not an object which can change value.
     """
 
+    __slots__ = ()
+
     _edge_type = simulator.VALUE_CHANGE
 
     @classmethod
@@ -407,6 +533,8 @@ class _Event(Trigger):
     can maintain a unique mapping of triggers to tasks.
     """
 
+    __slots__ = ("_parent", "_callback")
+
     def __init__(self, parent: "Event") -> None:
         super().__init__()
         self._parent = parent
@@ -428,6 +556,10 @@ class _Event(Trigger):
         return f"<{self._parent!r}.wait() at {_pointer_str(self)}>"
 
 
+# Emit the Event.set(data=...) deprecation warning only once per process.
+_event_data_warned = False
+
+
 class Event:
     r"""A way to signal an event across :class:`~cocotb.task.Task`\ s.
 
@@ -460,8 +592,12 @@ class Event:
         Removed the undocumented *data* attribute and argument to :meth:`set`.
     """
 
+    __slots__ = ("_pending_events", "name", "_fired", "_data")
+
     def __init__(self, name: Optional[str] = None) -> None:
-        self._pending_events: List[_Event] = []
+        # Keyed by id(trigger): O(1) unprime instead of a linear list scan,
+        # while dict insertion order preserves the fire order of waiters.
+        self._pending_events: Dict[int, _Event] = {}
         self.name: Optional[str] = name
         self._fired: bool = False
         self._data: Any = None
@@ -469,24 +605,46 @@ class Event:
     def _prime_trigger(
         self, trigger: _Event, callback: Callable[[Trigger], None]
     ) -> None:
-        self._pending_events.append(trigger)
+        self._pending_events[id(trigger)] = trigger
 
     def _unprime_trigger(self, trigger: _Event) -> None:
-        self._pending_events.remove(trigger)
+        self._pending_events.pop(id(trigger), None)
 
     def set(self, data: Optional[Any] = None) -> None:
         """Set the Event and unblock all Tasks blocked on this Event."""
         self._fired = True
         if data is not None:
-            warnings.warn(
-                "The data field will be removed in a future release.",
-                DeprecationWarning,
-            )
+            global _event_data_warned
+            if not _event_data_warned:
+                # warnings.warn walks the filter list on every call, which
+                # dominates for events set per clock; one notice is enough.
+                _event_data_warned = True
+                warnings.warn(
+                    "The data field will be removed in a future release.",
+                    DeprecationWarning,
+                )
         self._data = data
 
-        pending_events, self._pending_events = self._pending_events, []
-        for event in pending_events:
-            event._callback(event)
+        if not self._pending_events:
+            # Fast path for events set with no waiters (e.g. once per clock):
+            # skip the dict swap and batch dispatch entirely.
+            return
+        pending_events, self._pending_events = self._pending_events, {}
+        events = list(pending_events.values())
+        first_cb = events[0]._callback
+        scheduler = getattr(first_cb, "__self__", None)
+        if (
+            scheduler is not None
+            and first_cb == getattr(scheduler, "_react", None)
+            and all(event._callback == first_cb for event in events)
+        ):
+            # Every waiter was primed with the scheduler's _react (the normal
+            # case): wake the whole batch in one scheduler call instead of
+            # re-entering _react per waiter.
+            scheduler._react_many(events)
+        else:
+            for event in events:
+                event._callback(event)
 
     def wait(self) -> Trigger:
         """Block the current Task until the Event is set.
@@ -498,7 +656,7 @@ class Event:
         call :meth:`clear`.
         """
         if self._fired:
-            return NullTrigger(name=f"{str(self)}.wait()")
+            return _event_already_set
         return _Event(self)
 
     def clear(self) -> None:
@@ -530,6 +688,8 @@ class NullTrigger(Trigger):
         The *outcome* parameter was removed. There is no alternative.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: Optional[str] = None) -> None:
         super().__init__()
         self.name = name
@@ -545,6 +705,13 @@ class NullTrigger(Trigger):
         return fmt.format(type(self).__qualname__, self.name, _pointer_str(self))
 
 
+# Shared trigger returned by Event.wait() on an already-set Event.  Firing is
+# synchronous (_prime immediately invokes the callback, and the scheduler pops
+# its waiter entry before the next task runs), so one frozen instance can
+# serve every caller without allocating a NullTrigger and its name string.
+_event_already_set = NullTrigger(name="Event.wait()")
+
+
 class TaskComplete(Trigger, Generic[T]):
     r"""Fires when a :class:`~cocotb.task.Task` completes.
 
@@ -570,6 +737,8 @@ class TaskComplete(Trigger, Generic[T]):
     .. versionadded: 2.0
     """
 
+    __slots__ = ("_task",)
+
     def __new__(cls, task: "cocotb.task.Task[T]") -> "TaskComplete[T]":
         return task.complete
 
@@ -584,10 +753,10 @@ class TaskComplete(Trigger, Generic[T]):
         self._task = task
 
     def _prime(self, callback: Callable[[Trigger], None]) -> None:
-        if self._task.done():
+        if self._task._done:
             callback(self)
         else:
-            super()._prime(callback)
+            self._primed = True
 
     def __repr__(self) -> str:
         return f"{type(self).__qualname__}({self._task!s})"
@@ -10,6 +10,9 @@ from .range import Range  # noqa: E402 F401
 
 
 class ArrayLike(ABC, Generic[T]):
+    # empty so that concrete array types can opt into __slots__
+    __slots__ = ()
+
     @property
     def left(self) -> int:
         """Leftmost index of the array."""
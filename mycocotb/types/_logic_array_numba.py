@@ -0,0 +1,31 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Optional Numba-compiled kernels for LogicArray.
+
+Middle rung between the C extension and the pure Python fallback: when the
+C extension was not built but :mod:`numba` is installed, the packed
+table-lookup loop is JIT-compiled instead of interpreted. Importing this
+module raises :exc:`ImportError` when numba or numpy is missing;
+``logic_array`` treats that as "use the pure Python path".
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _packed_op_kernel(
+    a: np.ndarray, b: np.ndarray, table: np.ndarray, out: np.ndarray
+) -> None:
+    for i in range(a.size):
+        out[i] = table[(a[i] << 4) | b[i]]
+
+
+def packed_op(a: "bytearray", b: "bytearray", table: bytes) -> bytes:
+    """Apply a 256-entry lookup table to the packed pairs ``(a[i] << 4) | b[i]``."""
+    a_arr = np.frombuffer(a, dtype=np.uint8)
+    b_arr = np.frombuffer(b, dtype=np.uint8)
+    table_arr = np.frombuffer(table, dtype=np.uint8)
+    out = np.empty(a_arr.size, dtype=np.uint8)
+    _packed_op_kernel(a_arr, b_arr, table_arr, out)
+    return out.tobytes()
@@ -1,13 +1,24 @@
 # Copyright cocotb contributors
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
-from typing import Iterable, Iterator, TypeVar, Union, cast, overload
+from array import array as _c_array
+from typing import Iterable, Iterator, List, TypeVar, Union, cast, overload
 
 from mycocotb.types import ArrayLike
 from mycocotb.types.range import Range
 
 T = TypeVar("T")
 
+# Storage specialization: arrays whose elements are all plain ints (the common
+# case when mirroring numeric buses) are kept in a C-backed array("q") --
+# 8 bytes per element instead of a pointer to a boxed int, with C-level
+# slicing and comparison.  Any write whose value doesn't fit demotes the
+# storage back to a generic list.
+
+
+def _all_int(values: Iterable[object]) -> bool:
+    return all(type(v) is int for v in values)
+
 
 class Array(ArrayLike[T]):
     r"""Fixed-size, arbitrarily-indexed, homogeneous collection type.
@@ -125,6 +136,8 @@ class Array(ArrayLike[T]):
         TypeError: When invalid argument types are used.
     """
 
+    __slots__ = ("_value", "_range", "_range_left", "_range_step", "_range_len")
+
     @overload
     def __init__(self, value: Iterable[T]) -> None: ...
 
@@ -143,7 +156,13 @@ class Array(ArrayLike[T]):
         range: Union[Range, int, None] = None,
         width: Union[int, None] = None,
     ) -> None:
-        self._value = list(value)
+        value_ = list(value)
+        if value_ and _all_int(value_):
+            try:
+                value_ = _c_array("q", value_)
+            except OverflowError:
+                pass
+        self._value: Union[List[T], "_c_array[int]"] = value_
         if width is not None:
             if range is not None:
                 raise TypeError("Only provide argument to one of 'range' or 'width'")
@@ -162,6 +181,33 @@ class Array(ArrayLike[T]):
             raise ValueError(
                 f"Value of length {len(self._value)!r} does not fit in {self._range!r}"
             )
+        self._cache_range()
+
+    @classmethod
+    def _from_parts(cls, value: "list[T]", range: Range) -> "Array[T]":
+        """Construct an Array from an already-sized list and matching Range.
+
+        Fast path for internal callers (e.g. slicing) where both invariants
+        are known to hold; skips the iterable copy and length validation of
+        ``__init__``.
+        """
+        self = cls.__new__(cls)
+        self._value = value
+        self._range = range
+        self._cache_range()
+        return self
+
+    def _cache_range(self) -> None:
+        """Cache the range's integer parameters.
+
+        Index translation in :meth:`__getitem__`/:meth:`__setitem__` then
+        becomes plain integer arithmetic (see :meth:`_translate_index`)
+        instead of a :meth:`Range.index` call per access.
+        """
+        rng = self._range.to_range()
+        self._range_left = rng.start
+        self._range_step = rng.step
+        self._range_len = len(rng)
 
     @property
     def range(self) -> Range:
@@ -178,6 +224,11 @@ class Array(ArrayLike[T]):
                 f"{new_range!r} not the same length as old range ({self._range!r})."
             )
         self._range = new_range
+        self._cache_range()
+
+    def __len__(self) -> int:
+        # served from the cached range length rather than Range.__len__
+        return self._range_len
 
     def __iter__(self) -> Iterator[T]:
         return iter(self._value)
@@ -190,9 +241,22 @@ class Array(ArrayLike[T]):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Array):
-            return self._value == other._value
+            a = self._value
+            b = other._value
+            if type(a) is type(b):
+                return a == b
+            # mixed list/int-specialized storage; normalize before comparing
+            return list(a) == list(b)
         elif isinstance(other, (list, tuple)):
-            return self == Array(other)
+            # compare directly instead of building a throwaway Array; these
+            # comparisons sit in scoreboard inner loops
+            value = self._value
+            if type(value) is list:
+                return value == other if type(other) is list else value == list(other)
+            try:
+                return value == _c_array("q", other)
+            except (TypeError, OverflowError):
+                return list(value) == list(other)
         else:
             return NotImplemented
 
@@ -207,8 +271,14 @@ class Array(ArrayLike[T]):
             idx = self._translate_index(item)
             return self._value[idx]
         elif isinstance(item, slice):
-            start = item.start if item.start is not None else self.left
-            stop = item.stop if item.stop is not None else self.right
+            left = self._range_left
+            step = self._range_step
+            start = item.start if item.start is not None else left
+            stop = (
+                item.stop
+                if item.stop is not None
+                else left + (self._range_len - 1) * step
+            )
             if item.step is not None:
                 raise IndexError("do not specify step")
             start_i = self._translate_index(start)
@@ -218,8 +288,8 @@ class Array(ArrayLike[T]):
                     f"slice [{start}:{stop}] direction does not match array direction [{self.left}:{self.right}]"
                 )
             value = self._value[start_i : stop_i + 1]
-            range = Range(start, self.direction, stop)
-            return Array(value=value, range=range)
+            range = Range(start, "to" if step == 1 else "downto", stop)
+            return Array._from_parts(value, range)
         raise TypeError(f"indexes must be ints or slices, not {type(item).__name__}")
 
     @overload
@@ -233,10 +303,21 @@ class Array(ArrayLike[T]):
     ) -> None:
         if isinstance(item, int):
             idx = self._translate_index(item)
-            self._value[idx] = cast(T, value)
+            try:
+                self._value[idx] = cast(T, value)
+            except (TypeError, OverflowError):
+                # value doesn't fit the int-specialized storage; demote
+                self._value = list(self._value)
+                self._value[idx] = cast(T, value)
         elif isinstance(item, slice):
-            start = item.start if item.start is not None else self.left
-            stop = item.stop if item.stop is not None else self.right
+            left = self._range_left
+            step = self._range_step
+            start = item.start if item.start is not None else left
+            stop = (
+                item.stop
+                if item.stop is not None
+                else left + (self._range_len - 1) * step
+            )
             if item.step is not None:
                 raise IndexError("do not specify step")
             start_i = self._translate_index(start)
@@ -245,22 +326,46 @@ class Array(ArrayLike[T]):
                 raise IndexError(
                     f"slice [{start}:{stop}] direction does not match array direction [{self.left}:{self.right}]"
                 )
-            value = list(cast(Iterable[T], value))
-            if len(value) != (stop_i - start_i + 1):
+            # Lists and Arrays already carry their length and are only read
+            # from; slicing assignment doesn't need the defensive copy that
+            # arbitrary iterables do.
+            if isinstance(value, list):
+                vals = value
+            elif isinstance(value, Array):
+                vals = value._value
+            else:
+                vals = list(cast(Iterable[T], value))
+            if len(vals) != (stop_i - start_i + 1):
                 raise ValueError(
-                    f"value of length {len(value)!r} will not fit in slice [{start}:{stop}]"
+                    f"value of length {len(vals)!r} will not fit in slice [{start}:{stop}]"
                 )
-            self._value[start_i : stop_i + 1] = value
+            buf = self._value
+            if type(buf) is not list:
+                if type(vals) is _c_array:
+                    buf[start_i : stop_i + 1] = vals
+                    return
+                if _all_int(vals):
+                    try:
+                        buf[start_i : stop_i + 1] = _c_array("q", vals)
+                        return
+                    except OverflowError:
+                        pass
+                # new values don't fit the int-specialized storage; demote
+                buf = self._value = list(buf)
+            buf[start_i : stop_i + 1] = vals
         else:
             raise TypeError(
                 f"indexes must be ints or slices, not {type(item).__name__}"
             )
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self._value!r}, {self._range!r})"
+        return f"{type(self).__name__}({list(self._value)!r}, {self._range!r})"
 
     def _translate_index(self, item: int) -> int:
-        try:
-            return self._range.index(item)
-        except ValueError:
-            raise IndexError(f"index {item} out of range") from None
+        # (item - left) * step maps an index to its offset for either
+        # direction; one bounds check replaces the Range.index scan and the
+        # ValueError-to-IndexError remap.
+        offset = (item - self._range_left) * self._range_step
+        if 0 <= offset < self._range_len:
+            return offset
+        raise IndexError(f"index {item} out of range")
@@ -2,7 +2,7 @@
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
 from functools import lru_cache
-from typing import Dict, Optional, Set, Type, Union
+from typing import Any, Dict, Optional, Set, Type, Union
 
 LogicLiteralT = Union[str, int, bool]
 LogicConstructibleT = Union[LogicLiteralT, "Logic"]
@@ -150,68 +150,39 @@ class Logic:
             )
         return cls._map_literal(value)
 
+    @classmethod
+    def _coerce(cls, value: LogicConstructibleT) -> "Logic":
+        """Fast-path constructor for hot loops.
+
+        Serves every literal (and Logic instances themselves) from a flat
+        dict of the singletons, falling back to the normal constructor for
+        anything else so error behavior is unchanged.
+        """
+        try:
+            return _LOGIC_CACHE[value]
+        except (KeyError, TypeError):
+            return cls(value)
+
     def __and__(self, other: "Logic") -> "Logic":
         if not isinstance(other, Logic):
             return NotImplemented
-        return Logic(
-            (
-                # -----------------------------------------------------
-                # U    X    0    1    Z    W    L    H    -       |   |
-                # -----------------------------------------------------
-                ("U", "U", "0", "U", "U", "U", "0", "U", "U"),  # | U |
-                ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | X |
-                ("0", "0", "0", "0", "0", "0", "0", "0", "0"),  # | 0 |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 1 |
-                ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | Z |
-                ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | W |
-                ("0", "0", "0", "0", "0", "0", "0", "0", "0"),  # | L |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | H |
-                ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | - |
-            )[self._repr][other._repr]
-        )
+        return _and_results[self._repr][other._repr]
 
     def __or__(self: "Logic", other: "Logic") -> "Logic":
         if not isinstance(other, Logic):
             return NotImplemented
-        return Logic(
-            (
-                # -----------------------------------------------------
-                # U    X    0    1    Z    W    L    H    -       |   |
-                # -----------------------------------------------------
-                ("U", "U", "U", "1", "U", "U", "U", "1", "U"),  # | U |
-                ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | X |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 0 |
-                ("1", "1", "1", "1", "1", "1", "1", "1", "1"),  # | 1 |
-                ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | Z |
-                ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | W |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | L |
-                ("1", "1", "1", "1", "1", "1", "1", "1", "1"),  # | H |
-                ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | - |
-            )[self._repr][other._repr]
-        )
+        return _or_results[self._repr][other._repr]
 
     def __xor__(self: "Logic", other: "Logic") -> "Logic":
         if not isinstance(other, Logic):
             return NotImplemented
-        return Logic(
-            (
-                # -----------------------------------------------------
-                # U    X    0    1    Z    W    L    H    -       |   |
-                # -----------------------------------------------------
-                ("U", "U", "U", "U", "U", "U", "U", "U", "U"),  # | U |
-                ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | X |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 0 |
-                ("U", "X", "1", "0", "X", "X", "1", "0", "X"),  # | 1 |
-                ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | Z |
-                ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | W |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | L |
-                ("U", "X", "1", "0", "X", "X", "1", "0", "X"),  # | H |
-                ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | - |
-            )[self._repr][other._repr]
-        )
+        return _xor_results[self._repr][other._repr]
 
     def __invert__(self: "Logic") -> "Logic":
-        return Logic(("U", "X", "1", "0", "X", "X", "1", "0", "X")[self._repr])
+        return _invert_results[self._repr]
+
+    def __hash__(self) -> int:
+        return self._repr
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Logic):
@@ -247,3 +218,72 @@ class Logic:
 
     def __index__(self) -> int:
         return int(self)
+
+
+_LOGIC_CACHE: Dict[Any, Logic] = {
+    literal: Logic._get_object(_repr) for literal, _repr in _literal_repr.items()
+}
+_LOGIC_CACHE[None] = Logic._get_object(_X)
+# Logic values coerce to themselves.
+for _obj in tuple(_LOGIC_CACHE.values()):
+    _LOGIC_CACHE[_obj] = _obj
+def _make_result_table(matrix):
+    # Precompute each operation's result singletons so the operators above
+    # are two tuple indexes with no Logic construction per call.
+    return tuple(tuple(Logic._map_literal(c) for c in row) for row in matrix)
+
+
+_and_results = _make_result_table(
+    (
+        # -----------------------------------------------------
+        # U    X    0    1    Z    W    L    H    -       |   |
+        # -----------------------------------------------------
+        ("U", "U", "0", "U", "U", "U", "0", "U", "U"),  # | U |
+        ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | X |
+        ("0", "0", "0", "0", "0", "0", "0", "0", "0"),  # | 0 |
+        ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 1 |
+        ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | Z |
+        ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | W |
+        ("0", "0", "0", "0", "0", "0", "0", "0", "0"),  # | L |
+        ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | H |
+        ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | - |
+    )
+)
+
+_or_results = _make_result_table(
+    (
+        # -----------------------------------------------------
+        # U    X    0    1    Z    W    L    H    -       |   |
+        # -----------------------------------------------------
+        ("U", "U", "U", "1", "U", "U", "U", "1", "U"),  # | U |
+        ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | X |
+        ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 0 |
+        ("1", "1", "1", "1", "1", "1", "1", "1", "1"),  # | 1 |
+        ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | Z |
+        ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | W |
+        ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | L |
+        ("1", "1", "1", "1", "1", "1", "1", "1", "1"),  # | H |
+        ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | - |
+    )
+)
+
+_xor_results = _make_result_table(
+    (
+        # -----------------------------------------------------
+        # U    X    0    1    Z    W    L    H    -       |   |
+        # -----------------------------------------------------
+        ("U", "U", "U", "U", "U", "U", "U", "U", "U"),  # | U |
+        ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | X |
+        ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 0 |
+        ("U", "X", "1", "0", "X", "X", "1", "0", "X"),  # | 1 |
+        ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | Z |
+        ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | W |
+        ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | L |
+        ("U", "X", "1", "0", "X", "X", "1", "0", "X"),  # | H |
+        ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | - |
+    )
+)
+
+_invert_results = tuple(
+    Logic._map_literal(c) for c in ("U", "X", "1", "0", "X", "X", "1", "0", "X")
+)
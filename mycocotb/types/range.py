@@ -4,7 +4,7 @@
 from functools import lru_cache
 from typing import Iterator, Sequence, Union, overload
 
-from cocotb._utils import cached_method
+from mycocotb._utils import cached_method
 
 
 class Range(Sequence[int]):
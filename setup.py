@@ -4,6 +4,17 @@ import sysconfig
 # 获取 Python 包含目录
 python_include = sysconfig.get_paths()['include']
 
+# 本项目只从源码本机构建，不发布二进制包，所以可以放心用 -march=native；
+# -flto/-fno-semantic-interposition 让VPI包装层的热路径可以跨编译单元内联
+extra_compile_args = [
+    '-O3',
+    '-march=native',
+    '-flto',
+    '-fvisibility=hidden',
+    '-fno-semantic-interposition',
+]
+extra_link_args = ['-flto']
+
 # 定义扩展模块
 simulator_module = Extension(
     'simulator',
@@ -11,12 +22,23 @@ simulator_module = Extension(
     include_dirs=[python_include, "/usr/include/iverilog/"],
     # 实际上这个库是有对myvpi.vpl有外部符号依赖的，但因为它总是先于本库被加载，所以可以不写
     libraries=[],
-    library_dirs=[]
+    library_dirs=[],
+    extra_compile_args=extra_compile_args,
+    extra_link_args=extra_link_args,
+)
+
+# 可选的 LogicArray 加速内核；缺失时 logic_array.py 回退到纯 Python 实现
+logic_array_module = Extension(
+    'mycocotb.types._logic_array_c',
+    sources=['mycocotb/types/_logic_array_c.c'],
+    include_dirs=[python_include],
+    extra_compile_args=extra_compile_args,
+    extra_link_args=extra_link_args,
 )
 
 setup(
     name='simulator',
     version='1.0',
     description='Python extension to provide access to the simulator',
-    ext_modules=[simulator_module]
+    ext_modules=[simulator_module, logic_array_module]
 )
\ No newline at end of file
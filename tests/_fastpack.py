@@ -0,0 +1,24 @@
+# 可选的AOT编译打包助手：在本目录运行
+#   python _fastpack.py
+# 会用numba.pycc生成一个原生的 fastpack 扩展模块，提供
+# f2u(float32)->uint32 / u2f(uint32)->float32 的重解释转换。
+# 与@njit不同，AOT模块没有首次调用的JIT编译延迟，适合短测试。
+# 测试import不到 fastpack 时会自动回退到纯numpy实现。
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('fastpack')
+
+
+@cc.export('f2u', 'u4(f4)')
+def f2u(x):
+    return x.view(np.uint32)
+
+
+@cc.export('u2f', 'f4(u4)')
+def u2f(x):
+    return x.view(np.float32)
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -1,11 +1,17 @@
 import mycocotb as cocotb
+from mycocotb.clock import Clock
 from mycocotb.triggers import RisingEdge, FallingEdge, Timer
 import numpy as np
+import struct
 import sys
-import debugpy
-debugpy.listen(4000)
-print('Waiting for client...')
-# debugpy.wait_for_client()
+import os
+# 默认不启动debugpy：监听socket拖慢import且固定端口会让并行跑测试互相冲突。
+# 需要调试时设置 MYCOCOTB_DEBUG=1（端口可用 MYCOCOTB_DEBUG_PORT 指定）
+if os.environ.get('MYCOCOTB_DEBUG'):
+    import debugpy
+    debugpy.listen(int(os.environ.get('MYCOCOTB_DEBUG_PORT', '4000')))
+    print('Waiting for client...')
+    # debugpy.wait_for_client()
 
 # 定义矩阵和向量的维度
 MATRIX_ROWS = 4
@@ -14,36 +20,74 @@ MATRIX_COLS = 4
 # 定义FP32的位宽
 FP32_WIDTH = 32
 
-# 将浮点数转换为32位二进制表示
-def float_to_bin32(value):
-    return int.from_bytes(np.float32(value).tobytes(), byteorder='little')
-
-# 将32位二进制表示转换为浮点数
-def bin32_to_float(value):
-    return np.frombuffer(value.to_bytes(byteorder='little'), dtype=np.float32)[0]
-
-# 生成随机矩阵和向量
-def generate_random_matrix(rows, cols):
-    return np.random.randn(rows, cols).astype(np.float32)
-    # return 
-
-def generate_random_vector(size):
-    return np.random.randn(size).astype(np.float32)
-    # return 
-# 计算参考结果
-def compute_reference_result(matrix, vector):
-    return np.dot(matrix, vector)
-
-async def clock_gen(dut):
-    while True:
-        dut.clk.value = 0
-        await Timer(5)
-        dut.clk.value = 1
-        await Timer(5)
+# 浮点与32位码字的互转。优先使用预编译的AOT模块（见_fastpack.py），
+# 没有则回退到模块级编译好的struct：对单个标量，struct比numpy标量
+# 少两次数组对象构造，快数倍
+_F32 = struct.Struct('<f')
+_U32 = struct.Struct('<I')
+try:
+    from fastpack import f2u as float_to_bin32, u2f as bin32_to_float
+except ImportError:
+    def float_to_bin32(value):
+        return _U32.unpack(_F32.pack(value))[0]
+
+    def bin32_to_float(value):
+        return _F32.unpack(_U32.pack(value))[0]
+
+# 生成随机矩阵和向量；复用同一个Generator和预分配的scratch缓冲，
+# 长时间fuzz跑法下不再每轮分配新数组
+_RNG = np.random.default_rng()
+_SCRATCH_MATRIX = np.empty((MATRIX_ROWS, MATRIX_COLS), np.float32)
+_SCRATCH_VECTOR = np.empty(MATRIX_COLS, np.float32)
+
+def generate_random_matrix(rows, cols, out=None):
+    if out is None:
+        out = np.empty((rows, cols), np.float32)
+    _RNG.standard_normal(dtype=np.float32, out=out)
+    return out
+
+def generate_random_vector(size, out=None):
+    if out is None:
+        out = np.empty(size, np.float32)
+    _RNG.standard_normal(dtype=np.float32, out=out)
+    return out
+# 计算参考结果；装了numba就JIT掉np.dot对4x4小矩阵的调度开销
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def compute_reference_result(matrix, vector):
+        return matrix @ vector
+
+    # 预热一次，让JIT编译发生在import时而不是测试路径上
+    compute_reference_result(
+        np.zeros((MATRIX_ROWS, MATRIX_COLS), np.float32),
+        np.zeros(MATRIX_COLS, np.float32),
+    )
+else:
+    def compute_reference_result(matrix, vector):
+        return np.dot(matrix, vector)
+
+# 4元素的比较走np.allclose全是调度开销；有numba时用标量循环代替
+if numba is not None:
+    @numba.njit(cache=True)
+    def allclose(a, b, rtol):
+        for i in range(a.shape[0]):
+            if abs(a[i] - b[i]) > rtol * abs(b[i]) + 1e-8:
+                return False
+        return True
+
+    allclose(np.zeros(1, np.float32), np.zeros(1, np.float32), 1e-5)
+else:
+    def allclose(a, b, rtol):
+        return np.allclose(a, b, rtol=rtol)
 
 async def test_matrix_vector_multiplier(dut):
-    # 初始化时钟
-    cocotb.start_soon(clock_gen(dut))
+    # 初始化时钟；Clock复用两个Timer触发器，每周期不再新建对象
+    Clock(dut.clk, 10).start(start_high=False)
 
     # 复位模块
     dut.rst_n.value = 0
@@ -55,37 +99,35 @@ async def test_matrix_vector_multiplier(dut):
     # 测试数据
     test_data = [
         (np.eye(MATRIX_ROWS, MATRIX_COLS).astype(np.float32), np.ones((MATRIX_ROWS, )).astype(np.float32)),
-        (generate_random_matrix(MATRIX_ROWS, MATRIX_COLS), generate_random_vector(MATRIX_COLS))
+        (generate_random_matrix(MATRIX_ROWS, MATRIX_COLS, out=_SCRATCH_MATRIX), generate_random_vector(MATRIX_COLS, out=_SCRATCH_VECTOR))
     ]
     for matrix, vector in test_data:
-        # 将矩阵和向量加载到DUT
-        for i in range(MATRIX_ROWS):
-            for j in range(MATRIX_COLS):
-                dut.matrix[i*MATRIX_COLS + j].value = float_to_bin32(matrix[i][j])
-        for j in range(MATRIX_COLS):
-            dut.vector[j].value = float_to_bin32(vector[j])
+        # 将矩阵和向量加载到DUT；整块view成uint32，再对数组句柄整体赋值，
+        # 所有元素写入在同一个ReadWrite回调里一次性下发
+        matrix_codes = np.ascontiguousarray(matrix, dtype='<f4').view(np.uint32)
+        vector_codes = np.ascontiguousarray(vector, dtype='<f4').view(np.uint32)
+        dut.matrix.value = [int(v) for v in matrix_codes.ravel()]
+        dut.vector.value = [int(v) for v in vector_codes]
 
         # 启动计算
         dut.start.value = 1
         await RisingEdge(dut.clk)
         dut.start.value = 0
 
-        # 等待计算完成
-        while dut.done.value != 1:
-            await RisingEdge(dut.clk)
+        # 等待计算完成；在done上触发一次，而不是每个时钟周期都唤醒Python轮询
+        await RisingEdge(dut.done)
 
-        # 读取结果并转换为浮点数
-        result = np.zeros(MATRIX_ROWS, dtype=np.float32)
-        for i in range(MATRIX_ROWS):
-            print(f'dut.result[i].value = {dut.result[i].value}')
-            # rpdb.set_trace()
-            result[i] = bin32_to_float(dut.result[i].value)
+        # 读取结果并转换为浮点数：先收齐整型码字，再整块view成float32
+        raw = np.array(
+            [int(dut.result[i].value) for i in range(MATRIX_ROWS)], dtype='<u4'
+        )
+        result = raw.view(np.float32)
 
         # 计算参考结果
         reference_result = compute_reference_result(matrix, vector)
 
         # 验证结果
-        assert np.allclose(result, reference_result, rtol=1e-5), \
+        assert allclose(result, reference_result, 1e-5), \
             f"Test failed: Expected {reference_result}, got {result}"
 
         # 打印测试结果
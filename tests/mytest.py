@@ -1,9 +1,13 @@
 import mycocotb
 from mycocotb.triggers import NullTrigger, Timer, RisingEdge, FallingEdge
-import debugpy
-debugpy.listen(4000)
-print('Waiting for client...')
-# debugpy.wait_for_client()
+import os
+# 默认不启动debugpy：监听socket拖慢import且固定端口会让并行跑测试互相冲突。
+# 需要调试时设置 MYCOCOTB_DEBUG=1（端口可用 MYCOCOTB_DEBUG_PORT 指定）
+if os.environ.get('MYCOCOTB_DEBUG'):
+    import debugpy
+    debugpy.listen(int(os.environ.get('MYCOCOTB_DEBUG_PORT', '4000')))
+    print('Waiting for client...')
+    # debugpy.wait_for_client()
 
 class Future():
     def __await__(self):
@@ -40,9 +40,9 @@ async def test_fp_multiplier_com(dut):
         dut.a.value = float_to_bin32(a)
         dut.b.value = float_to_bin32(b)
 
-        # 等待几个时钟周期以获取输出
-        await RisingEdge(dut.clk)
-        await RisingEdge(dut.clk)
+        # DUT是纯组合逻辑且没有valid选通：等1ns让写入生效、组合逻辑
+        # 稳定即可，每组向量只唤醒Python一次，而不是两个时钟边沿
+        await Timer(1, units="ns")
 
         # 获取输出
         result = int(dut.result.value)